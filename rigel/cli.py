@@ -2,6 +2,8 @@ import click
 import os
 import signal
 import sys
+import time
+from collections import Counter
 from pathlib import Path
 from rigelcore.clients import DockerClient
 from rigelcore.exceptions import RigelError
@@ -28,6 +30,9 @@ from typing import Any, Dict, List, Tuple, Union
 
 MESSAGE_LOGGER = MessageLogger()
 
+# Interval (in seconds) between consecutive checks on the state of a running simulation.
+SIMULATION_POLLING_INTERVAL = 0.1
+
 
 def handle_rigel_error(err: RigelError) -> None:
     """
@@ -84,6 +89,42 @@ def rigelfile_exists() -> bool:
     return os.path.isfile('./Rigelfile')
 
 
+def select_packages(rigelfile: Rigelfile, pkg: Tuple[str, ...]) -> List[Union[DockerSection, DockerfileSection]]:
+    """
+    Selects the packages declared in a Rigelfile that were requested by the user,
+    preserving their declaration order. All declared packages are selected if
+    none was requested. Each requested name selects at most one declaration, the
+    first one not yet selected; requesting a name more times than it is declared
+    is reported as an unknown package.
+
+    Args:
+        rigelfile (Rigelfile): The parsed Rigelfile holding all package declarations.
+        pkg (Tuple[str, ...]): Names of the requested packages.
+
+    Returns:
+        List[Union[DockerSection, DockerfileSection]]: The selected package
+        declarations.
+
+    """
+    if not pkg:  # consider all declared packages
+        return rigelfile.packages
+
+    requested = Counter(pkg)
+    desired_packages: List[Union[DockerSection, DockerfileSection]] = []
+    for package in rigelfile.packages:
+        if requested[package.package]:
+            desired_packages.append(package)
+            requested[package.package] -= 1
+
+    if any(requested.values()):  # check if an unknown package was referenced
+        unknown_packages = list(pkg)
+        for package in desired_packages:
+            unknown_packages.remove(package.package)
+        raise UnknownROSPackagesError(packages=', '.join(unknown_packages))
+
+    return desired_packages
+
+
 def load_plugin(
         plugin: PluginSection,
         application_args: List[Any],
@@ -115,11 +156,13 @@ def load_plugin(
 
         loader = PluginLoader()
 
-        if application_args:
-            plugin.args = application_args + plugin.args
-
-        if application_kwargs:
-            plugin.kwargs.update(application_kwargs)
+        # Apply overrides to a shallow copy so that the parsed Rigelfile
+        # section is left untouched and can be safely reused.
+        if application_args or application_kwargs:
+            plugin = plugin.copy(update={
+                'args': application_args + plugin.args,
+                'kwargs': {**plugin.kwargs, **application_kwargs}
+            })
 
         plugin_instance = loader.load(plugin)
 
@@ -129,6 +172,37 @@ def load_plugin(
     return (plugin.name, plugin_instance)
 
 
+def register_stop_handler(plugin_name: str, plugin_instance: Plugin) -> None:
+    """
+    Installs a single handler for both SIGINT and SIGTSTP signals that gracefully
+    stops a running plugin instance. Since the handler exits the program by raising
+    `SystemExit`, any pending `finally` blocks still get executed.
+
+    Args:
+        plugin_name (str): The name of the plugin, used for logging purposes.
+        plugin_instance (Plugin): The running plugin instance to be stopped.
+
+    """
+
+    def stop_plugin(*args: Any) -> None:
+        """
+        Terminates a plugin instance and logs a message indicating graceful
+        shutdown. It then exits the program with exit code 0, indicating
+        successful termination. The function accepts any number of arguments,
+        but does not use them.
+
+        Args:
+            *args (Any): List of positional arguments
+
+        """
+        plugin_instance.stop()
+        MESSAGE_LOGGER.info(f"Plugin '{plugin_name}' stopped executing gracefully.")
+        sys.exit(0)
+
+    signal.signal(signal.SIGINT, stop_plugin)
+    signal.signal(signal.SIGTSTP, stop_plugin)
+
+
 def run_plugin(plugin: Tuple[str, Plugin]) -> None:
     """
     Executes an external plugin, runs it until its termination, and handles any
@@ -146,23 +220,7 @@ def run_plugin(plugin: Tuple[str, Plugin]) -> None:
 
         plugin_name, plugin_instance = plugin
 
-        def stop_plugin(*args: Any) -> None:
-            """
-            Terminates a plugin instance and logs a message indicating graceful
-            shutdown. It then exits the program with exit code 0, indicating
-            successful termination. The function accepts any number of arguments,
-            but does not use them.
-
-            Args:
-                *args (Any): List of positional arguments
-
-            """
-            plugin_instance.stop()
-            MESSAGE_LOGGER.info(f"Plugin '{plugin_name}' stopped executing gracefully.")
-            sys.exit(0)
-
-        signal.signal(signal.SIGINT, stop_plugin)
-        signal.signal(signal.SIGTSTP, stop_plugin)
+        register_stop_handler(plugin_name, plugin_instance)
 
         MESSAGE_LOGGER.warning(f"Executing external plugin '{plugin_name}'.")
         plugin_instance.run()
@@ -195,30 +253,16 @@ def run_simulation_plugin(
 
         plugin_name, plugin_instance = plugin
 
-        def stop_plugin(*args: Any) -> None:
-            """
-            Terminates a plugin instance and logs a message to indicate graceful
-            termination. It takes any number of arguments, stops the plugin using
-            its `stop` method, and then exits the program with exit code 0.
-
-            Args:
-                *args (Any): List of positional arguments
-
-            """
-            plugin_instance.stop()
-            MESSAGE_LOGGER.info(f"Plugin '{plugin_name}' stopped executing gracefully.")
-            sys.exit(0)
-
-        signal.signal(signal.SIGINT, stop_plugin)
-        signal.signal(signal.SIGTSTP, stop_plugin)
+        register_stop_handler(plugin_name, plugin_instance)
 
         MESSAGE_LOGGER.warning(f"Executing external plugin '{plugin_name}'.")
         plugin_instance.run()
         MESSAGE_LOGGER.warning("Simulation started.")
 
-        while True:  # wait for test stage to finish
-            if manager.finished:
-                break
+        # Wait for test stage to finish.
+        # Sleep between checks so that the ROS bridge threads updating the manager are not starved.
+        while not manager.finished:
+            time.sleep(SIMULATION_POLLING_INTERVAL)
 
         print(manager)
         plugin_instance.stop()
@@ -314,21 +358,9 @@ def create(pkg: Tuple[str]) -> None:
             specify a list of desired packages when calling the command.
 
     """
-    list_packages = list(pkg)
     try:
         rigelfile = parse_rigelfile()
-        if not list_packages:  # consider all declared packages
-            desired_packages = rigelfile.packages
-        else:
-            desired_packages = []
-            for package in rigelfile.packages:
-                if package.package in list_packages:
-                    desired_packages.append(package)
-                    list_packages.remove(package.package)
-            if list_packages:  # check if an unknown package was referenced
-                raise UnknownROSPackagesError(packages=', '.join(list_packages))
-
-        for package in desired_packages:
+        for package in select_packages(rigelfile, pkg):
             if isinstance(package, DockerSection):
                 create_package_files(package)
 
@@ -418,11 +450,8 @@ def containerize_package(package: DockerSection, load: bool, push: bool) -> None
     if package.ssh and not package.rosinstall:
         MESSAGE_LOGGER.warning('No .rosinstall file was declared. Recommended to remove unused SSH keys from Dockerfile.')
 
-    buildargs: Dict[str, str] = {}
-    for key in package.ssh:
-        if not key.file:
-            value = os.environ[key.value]  # NOTE: SSHKey model ensures that environment variable is declared.
-            buildargs[key.value] = value
+    # NOTE: SSHKey model ensures that environment variables are declared.
+    buildargs: Dict[str, str] = {key.value: os.environ[key.value] for key in package.ssh if not key.file}
 
     path = generate_paths(package)
 
@@ -537,21 +566,9 @@ def build(pkg: Tuple[str], load: bool, push: bool) -> None:
             otherwise.
 
     """
-    list_packages = list(pkg)
     rigelfile = parse_rigelfile()
     try:
-        if not list_packages:  # consider all declared packages
-            desired_packages = rigelfile.packages
-        else:
-            desired_packages = []
-            for package in rigelfile.packages:
-                if package.package in list_packages:
-                    desired_packages.append(package)
-                    list_packages.remove(package.package)
-            if list_packages:  # check if an unknown package was referenced
-                raise UnknownROSPackagesError(packages=', '.join(list_packages))
-
-        for package in desired_packages:
+        for package in select_packages(rigelfile, pkg):
             if isinstance(package, DockerSection):
                 containerize_package(package, load, push)
             else:  # DockerfileSection
@@ -596,12 +613,14 @@ def run() -> None:
     rigelfile = parse_rigelfile()
     if rigelfile.simulate:
 
+        # Building the HPL grammar is expensive, so a single parser is shared by all plugins.
+        requirements_parser = SimulationRequirementsParser()
+
         for plugin_section in rigelfile.simulate.plugins:
 
             requirements_manager = SimulationRequirementsManager(rigelfile.simulate.timeout)
 
             # Parse simulation requirements.
-            requirements_parser = SimulationRequirementsParser()
             for hpl_statement in rigelfile.simulate.introspection:
                 requirement = requirements_parser.parse(hpl_statement)
                 requirement.father = requirements_manager
@@ -1,13 +1,11 @@
-import shutil
-from pkg_resources import resource_filename
+from rigel.files.resources import load_resource
 
 
 class RigelfileCreator:
     """
-    Copies a file named "Rigelfile" from a specific path within the project's
-    assets to the current directory. The copying operation is done using the
-    `shutil.copyfile` function, which ensures that all metadata (permissions,
-    timestamp) of the source file are preserved in the destination file.
+    Copies a file named "Rigelfile" from the project's assets to the current
+    directory. The asset is read through the package loader, so it is found
+    whether Rigel is installed as regular files or imported from an archive.
 
     """
 
@@ -18,6 +16,5 @@ class RigelfileCreator:
         specified location.
 
         """
-
-        rigelfile_path = resource_filename(__name__, 'assets/Rigelfile')
-        shutil.copyfile(rigelfile_path, 'Rigelfile')
+        with open('Rigelfile', 'wb') as rigelfile:
+            rigelfile.write(load_resource('assets/Rigelfile'))
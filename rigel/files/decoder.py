@@ -1,90 +1,104 @@
 import os
 import re
+import sys
 from rigelcore.exceptions import UndeclaredGlobalVariableError
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Match, Tuple
+
+# Template variables are enclosed between '{{' and '}}' delimiters.
+VARIABLE_PATTERN = re.compile(r'{{([a-zA-Z0-9_\s\-\!\?]+)}}')
+
+# Decoded string values shorter than this are interned.
+INTERN_MAX_LENGTH = 64
 
 
 class YAMLDataDecoder:
     """
     Decodes YAML data by replacing template variables enclosed between `{{ }}`
     delimiters with their corresponding values from a dictionary or environment
-    variables. It recursively traverses dictionaries and lists to process nested
+    variables. It iteratively traverses dictionaries and lists to process nested
     structures.
 
     """
 
-    def __extract_variable_name(self, match: str) -> str:
+    def __extract_variable_name(self, match: Match[str]) -> str:
         """
-        Removes curly braces and spaces from a given string, effectively extracting
-        a variable name from a YAML-like format.
+        Removes spaces from the content enclosed by a pair of delimiters,
+        effectively extracting a variable name from a YAML-like format.
 
         """
-        chars_to_remove = ['{', '}', ' ']
-        variable_name = match
-        for c in chars_to_remove:
-            variable_name = variable_name.replace(c, '')
-        return variable_name
+        return match.group(1).replace(' ', '')
 
-    def __aux_decode(self, data: Any, vars: Any, path: str = '') -> None:
+    def __decode_string(self, value: str, vars: Any, path: str) -> str:
         """
-        Recursively decodes complex data structures such as dictionaries and lists
-        from their encoded form to their original structure.
+        Replaces all template variables found in a string with their values,
+        taken either from the declared variables or from environment variables,
+        in a single pass. Raises an error for undeclared global variables.
 
         """
-        if isinstance(data, dict):
-            self.__aux_decode_dict(data, vars, path)
-        elif isinstance(data, list):
-            self.__aux_decode_list(data, vars, path)
+        if '{{' not in value:  # skip the regular expression engine for plain strings
+            return value
 
-    def __aux_decode_dict(self, data: Any, vars: Any, path: str = '') -> None:
-        """
-        Recursively decodes a dictionary by replacing placeholder variables with
-        actual values from environment variables or an input dictionary, ensuring
-        that string fields contain delimiters and raising an error for undeclared
-        global variables.
+        def replace(match: Match[str]) -> str:
+            variable_name = self.__extract_variable_name(match)
+            if variable_name in vars:
+                return str(vars[variable_name])
+            elif variable_name in os.environ:
+                return os.environ[variable_name]
+            raise UndeclaredGlobalVariableError(field=path, var=variable_name)
+
+        return VARIABLE_PATTERN.sub(replace, value)
 
+    def __aux_decode(self, data: Any, vars: Any) -> None:
         """
-        for k, v in data.items():
-
-            new_path = f'{path}.{k}' if path else k
-
-            if isinstance(v, str):  # in order to contain delimiters the field must be of type str
-                matches = re.findall(r'{{[a-zA-Z0-9_\s\-\!\?]+}}', v)
-                for match in matches:
-                    variable_name = self.__extract_variable_name(match)
-                    if variable_name in vars:
-                        data[k] = data[k].replace(match, vars[variable_name])
-                    elif variable_name in os.environ:
-                        data[k] = data[k].replace(match, os.environ[variable_name])
-                    else:
-                        raise UndeclaredGlobalVariableError(field=new_path, var=variable_name)
-            else:
-                self.__aux_decode(v, vars, new_path)
-
-    def __aux_decode_list(self, data: Any, vars: Dict[str, Any], path: str = '') -> None:
+        Decodes complex data structures such as dictionaries and lists in place.
+        Nested containers are walked depth-first, in document order, using an
+        explicit stack of (container, path, items) frames instead of one
+        recursive call per node. Preserving the order ensures that the 'vars'
+        section is decoded before the sections that reference it.
+
         """
-        Recursively decodes a list by replacing placeholders ({{}}) with actual
-        values from variables or environment variables, and then calls itself for
-        each element in the list if it's not a string.
+        stack: List[Tuple[Any, str, Iterator[Tuple[Any, Any]]]] = [(data, '', self.__iterate(data))]
+
+        # Bind frequently used callables to locals to avoid repeated attribute lookups.
+        push = stack.append
+        decode_string = self.__decode_string
+        intern = sys.intern
+
+        while stack:
 
+            container, path, items = stack[-1]
+
+            is_dict = isinstance(container, dict)
+            for key, value in items:
+
+                if not isinstance(value, (str, dict, list)):
+                    continue
+
+                if is_dict:
+                    new_path = f'{path}.{key}' if path else str(key)
+                else:
+                    new_path = f'{path}[{key}]'
+
+                if isinstance(value, str):  # in order to contain delimiters the field must be of type str
+                    decoded = decode_string(value, vars, new_path)
+                    # Short values (distros, compilers, hostnames, ...) tend to be repeated
+                    # across packages and are shared as a single interned object.
+                    container[key] = intern(decoded) if len(decoded) < INTERN_MAX_LENGTH else decoded
+                else:
+                    # Decode the nested container first and resume the current one afterwards.
+                    push((value, new_path, self.__iterate(value)))
+                    break
+
+            else:  # all items of the current container were decoded
+                stack.pop()
+
+    def __iterate(self, container: Any) -> Iterator[Tuple[Any, Any]]:
         """
+        Returns an iterator over the (key, value) pairs of a dictionary or the
+        (index, element) pairs of a list.
 
-        for idx, elem in enumerate(data):
-
-            new_path = f'{path}[{idx}]'
-
-            if isinstance(elem, str):  # in order to contain delimiters the field must be of type str
-                matches = re.findall(r'{{[a-zA-Z0-9_\s\-\!\?]+}}', elem)
-                for match in matches:
-                    variable_name = self.__extract_variable_name(match)
-                    if variable_name in vars:
-                        data[idx] = data[idx].replace(match, vars[variable_name])
-                    elif variable_name in os.environ:
-                        data[idx] = data[idx].replace(match, os.environ[variable_name])
-                    else:
-                        raise UndeclaredGlobalVariableError(field=new_path, var=variable_name)
-            else:
-                self.__aux_decode(elem, vars, new_path)
+        """
+        return iter(container.items()) if isinstance(container, dict) else enumerate(container)
 
     def decode(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
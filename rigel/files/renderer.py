@@ -1,6 +1,26 @@
+from functools import lru_cache
 from jinja2 import Template
-from pkg_resources import resource_string
+from rigel.files.resources import load_resource
 from rigel.models import DockerSection
+from typing import Any, Dict
+
+
+@lru_cache(maxsize=None)
+def load_template(template: str) -> Template:
+    """
+    Reads and compiles a template file located in the 'assets/templates/'
+    directory. Compiled templates are cached so that each template file is
+    read and compiled at most once, no matter how many packages are rendered.
+
+    Args:
+        template (str): The name of the template file.
+
+    Returns:
+        Template: The compiled Jinja2 template.
+
+    """
+    compiled_template: Template = Template(load_resource(f'assets/templates/{template}').decode('utf-8'))
+    return compiled_template
 
 
 class Renderer:
@@ -13,15 +33,21 @@ class Renderer:
         configuration_file (DockerSection): Initialized during object creation
             with a specified configuration file. It represents a configuration
             file for rendering templates.
+        configuration (Dict[str, Any]): The serialized form of `configuration_file`.
+            It is computed once during object creation and shared by all rendered
+            templates.
 
     """
 
+    __slots__ = ('configuration_file', 'configuration')
+
     def __init__(self, configuration_file: DockerSection) -> None:
         """
         :type configuration_file: rigel.models.DockerSection
         :param configuration_file: An aggregator of information about the containerization of the ROS application.
         """
         self.configuration_file = configuration_file
+        self.configuration: Dict[str, Any] = configuration_file.dict()
 
     def render(self, template: str, output: str) -> None:
         """
@@ -35,9 +61,8 @@ class Renderer:
                 rendered template will be written.
 
         """
-        # Open file template.
-        dockerfile_template = resource_string(__name__, f'assets/templates/{template}').decode('utf-8')
-        dockerfile_templater = Template(dockerfile_template)
+        dockerfile_templater = load_template(template)
 
-        with open(output, 'w+') as output_file:
-            output_file.write(dockerfile_templater.render(configuration=self.configuration_file.dict()))
+        # Write the rendered template to the output file chunk by chunk
+        # instead of building the whole document in memory first.
+        dockerfile_templater.stream(configuration=self.configuration).dump(output, encoding='utf-8')
@@ -0,0 +1,22 @@
+import pkgutil
+
+
+def load_resource(resource: str) -> bytes:
+    """
+    Reads a resource file shipped with the 'rigel.files' package, such as the
+    Rigelfile template or the Jinja2 templates, through the package loader.
+    This works for regular installs as well as for zip imports. A
+    FileNotFoundError is raised if the loader cannot provide the resource.
+
+    Args:
+        resource (str): The path of the resource file, relative to the
+            'rigel/files/' directory (e.g. 'assets/Rigelfile').
+
+    Returns:
+        bytes: The raw contents of the resource file.
+
+    """
+    data = pkgutil.get_data(__name__, resource)
+    if data is None:  # the package loader does not support reading resources
+        raise FileNotFoundError(f"Unable to load resource '{resource}' from package 'rigel.files'.")
+    return data
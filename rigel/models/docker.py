@@ -1,5 +1,5 @@
 import os
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, root_validator, validator
 from rigelcore.exceptions import (
     UndeclaredEnvironmentVariableError
 )
@@ -7,15 +7,19 @@ from rigel.exceptions import (
     UnsupportedCompilerError,
     UnsupportedPlatformError
 )
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 
+SUPPORTED_COMPILERS: FrozenSet[str] = frozenset(['catkin_make', 'colcon'])
+
 SUPPORTED_PLATFORMS: List[Tuple[str, str, str]] = [
     # (docker_platform_name, qus_argument, qemu_file_name)
     ('linux/amd64', 'x86_64', ''),
     ('linux/arm64', 'arm', 'qemu-arm')
 ]
 
+SUPPORTED_DOCKER_PLATFORMS: FrozenSet[str] = frozenset(platform[0] for platform in SUPPORTED_PLATFORMS)
+
 
 class SSHKey(BaseModel):
     """
@@ -163,20 +167,24 @@ class DockerSection(BaseModel):
     ssh: List[SSHKey] = []
     username: str = 'rigeluser'
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    @root_validator(pre=True)
+    def default_ros_image(cls, values: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Initializes an object by calling its superclass's constructor with the
-        provided arguments and keyword-arguments. It also sets a 'ros_image'
-        attribute if it is not already set, based on a 'distro' argument.
+        Sets the 'ros_image' field to the value of the 'distro' field whenever
+        the former is not provided. Runs before field validation, and only
+        touches the input data when a default is actually needed.
 
         Args:
-            *args (Any): List of positional arguments
-            **kwargs (Any): Dictionary of keyword arguments
+            values (Dict[str, Any]): The raw input data for the model.
+
+        Returns:
+            Dict[str, Any]: The input data, including a 'ros_image' entry
+            whenever a 'distro' entry is available.
 
         """
-        if not kwargs.get('ros_image') and kwargs.get('distro'):
-            kwargs['ros_image'] = kwargs['distro']
-        super().__init__(*args, **kwargs)
+        if not values.get('ros_image') and values.get('distro'):
+            return {**values, 'ros_image': values['distro']}
+        return values
 
     @validator('compiler')
     def validate_compiler(cls, compiler: str) -> str:
@@ -197,7 +205,7 @@ class DockerSection(BaseModel):
 
         """
         # NOTE: At the moment only "catkin" and "colcon" are supported.
-        if compiler not in ['catkin_make', 'colcon']:
+        if compiler not in SUPPORTED_COMPILERS:
             raise UnsupportedCompilerError(compiler=compiler)
         return compiler
 
@@ -218,9 +226,8 @@ class DockerSection(BaseModel):
             supported by the system, so the original list is returned unchanged.
 
         """
-        supported_platforms = [p[0] for p in SUPPORTED_PLATFORMS]
         for platform in platforms:
-            if platform not in supported_platforms:
+            if platform not in SUPPORTED_DOCKER_PLATFORMS:
                 raise UnsupportedPlatformError(platform=platform)
         return platforms
 
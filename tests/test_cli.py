@@ -0,0 +1,62 @@
+import unittest
+from rigel.cli import select_packages
+from rigel.exceptions import UnknownROSPackagesError
+from unittest.mock import Mock
+
+
+class SelectPackagesTesting(unittest.TestCase):
+    """
+    Test suite for rigel.cli.select_packages function.
+    """
+
+    def setUp(self) -> None:
+        """
+        Declare a Rigelfile with three packages, two of them sharing the same name.
+        """
+        self.package_a = Mock(package='package_a')
+        self.package_b = Mock(package='package_b')
+        self.package_a_copy = Mock(package='package_a')
+        self.rigelfile = Mock(packages=[self.package_a, self.package_b, self.package_a_copy])
+
+    def test_all_packages_selected(self) -> None:
+        """
+        Test if all declared packages are selected if no package is requested.
+        """
+        self.assertEqual(select_packages(self.rigelfile, ()), self.rigelfile.packages)
+
+    def test_declaration_order_preserved(self) -> None:
+        """
+        Test if the selected packages follow the declaration order, not the request order.
+        """
+        selected = select_packages(self.rigelfile, ('package_b', 'package_a'))
+        self.assertEqual(selected, [self.package_a, self.package_b])
+
+    def test_unknown_packages_error(self) -> None:
+        """
+        Test if UnknownROSPackagesError is thrown, in request order, if unknown packages are requested.
+        """
+        with self.assertRaises(UnknownROSPackagesError) as context:
+            select_packages(self.rigelfile, ('unknown_2', 'package_a', 'unknown_1'))
+        self.assertEqual(context.exception.kwargs['packages'], 'unknown_2, unknown_1')
+
+    def test_duplicated_declarations(self) -> None:
+        """
+        Test if each requested name only selects the first matching declaration not yet selected.
+        """
+        self.assertEqual(select_packages(self.rigelfile, ('package_a',)), [self.package_a])
+        self.assertEqual(
+            select_packages(self.rigelfile, ('package_a', 'package_a')),
+            [self.package_a, self.package_a_copy]
+        )
+
+    def test_duplicated_requests(self) -> None:
+        """
+        Test if UnknownROSPackagesError is thrown if a name is requested more times than it is declared.
+        """
+        with self.assertRaises(UnknownROSPackagesError) as context:
+            select_packages(self.rigelfile, ('package_b', 'package_b'))
+        self.assertEqual(context.exception.kwargs['packages'], 'package_b')
+
+
+if __name__ == '__main__':
+    unittest.main()
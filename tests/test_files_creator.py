@@ -1,6 +1,6 @@
 import unittest
 from rigel.files.creator import RigelfileCreator
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, mock_open, patch
 
 
 class RigelfileCreatorTesting(unittest.TestCase):
@@ -8,23 +8,24 @@ class RigelfileCreatorTesting(unittest.TestCase):
     Test suite for rigel.files.RigelfileCreator class.
     """
 
-    @patch('rigel.files.creator.resource_filename')
-    @patch('rigel.files.creator.shutil.copyfile')
+    @patch('rigel.files.creator.load_resource')
+    @patch('builtins.open', new_callable=mock_open())
     def test_rigelfile_creation(
             self,
-            shutil_mock: Mock,
+            open_mock: Mock,
             resources_mock: Mock
             ) -> None:
         """
         Test if the creation of a new Rigelfile is done as expected.
         """
-        filepath = 'test_path/Rigelfile'
-        resources_mock.return_value = filepath
+        rigelfile_data = b'Rigelfile content.'
+        resources_mock.return_value = rigelfile_data
 
         creator = RigelfileCreator()
         creator.create()
-        resources_mock.assert_called_once_with('rigel.files.creator', 'assets/Rigelfile')
-        shutil_mock.assert_called_once_with(filepath, 'Rigelfile')
+        resources_mock.assert_called_once_with('assets/Rigelfile')
+        open_mock.assert_called_once_with('Rigelfile', 'wb')
+        open_mock.return_value.__enter__().write.assert_called_once_with(rigelfile_data)
 
 
 if __name__ == '__main__':
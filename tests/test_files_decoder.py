@@ -1,6 +1,7 @@
 import unittest
 from rigelcore.exceptions import UndeclaredGlobalVariableError
 from rigel.files import YAMLDataDecoder
+from unittest.mock import patch
 
 
 class YAMLDataDecoderTesting(unittest.TestCase):
@@ -65,6 +66,51 @@ class YAMLDataDecoderTesting(unittest.TestCase):
         self.assertEqual(decoded_test_data['test_key'][0], template_value)
         self.assertEqual(decoded_test_data['test_key'][1], unchanged_value)  # control value
 
+    @patch.dict('rigel.files.decoder.os.environ', {'env_var': 'env_value'})
+    def test_decoding_mechanism_multiple_variables(self) -> None:
+        """
+        Test if decoding mechanism works as expected whenever a single field
+        references multiple global and environment variables.
+        """
+        test_data = {
+            'vars': {'template_var': 'test_value'},
+            'test_key': '{{ template_var }}-{{env_var}}-{{ template_var }}'
+        }
+        decoder = YAMLDataDecoder()
+        decoded_test_data = decoder.decode(test_data)
+        self.assertEqual(decoded_test_data['test_key'], 'test_value-env_value-test_value')
+
+    @patch.dict('rigel.files.decoder.os.environ', {'env_var': 'env_value'})
+    def test_decoding_mechanism_nested_variables(self) -> None:
+        """
+        Test if global variables that reference other variables are decoded
+        before being used by the remaining fields.
+        """
+        test_data = {
+            'vars': {'base': '{{ env_var }}'},
+            'packages': [{'image': '{{ base }}/image', 'run': [['{{ base }}']]}]
+        }
+        decoder = YAMLDataDecoder()
+        decoded_test_data = decoder.decode(test_data)
+        self.assertEqual(decoded_test_data['packages'][0]['image'], 'env_value/image')
+        self.assertEqual(decoded_test_data['packages'][0]['run'][0][0], 'env_value')
+
+    def test_undeclared_variable_error_document_order(self) -> None:
+        """
+        Test if UndeclaredGlobalVariableError refers to the first field,
+        in document order, that references an unknown variable.
+        """
+        test_data = {
+            'vars': {},
+            'other': {'nested': {'a': '{{ first_unknown }}'}, 'b': '{{ second_unknown }}'},
+            'z': {'c': '{{ third_unknown }}'}
+        }
+        with self.assertRaises(UndeclaredGlobalVariableError) as context:
+            decoder = YAMLDataDecoder()
+            decoder.decode(test_data)
+        self.assertEqual(context.exception.kwargs['field'], 'other.nested.a')
+        self.assertEqual(context.exception.kwargs['var'], 'first_unknown')
+
 
 if __name__ == '__main__':
     unittest.main()
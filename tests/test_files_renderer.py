@@ -1,7 +1,8 @@
 import unittest
 from rigel.files import Renderer
+from rigel.files.renderer import load_template
 from rigel.models import DockerSection
-from unittest.mock import MagicMock, Mock, mock_open, patch
+from unittest.mock import MagicMock, Mock, patch
 
 
 class RendererTesting(unittest.TestCase):
@@ -16,12 +17,22 @@ class RendererTesting(unittest.TestCase):
         'image': 'test_image'
     }
 
-    @patch('rigel.files.renderer.resource_string')
+    def setUp(self) -> None:
+        """
+        Ensure that no compiled template is shared between tests.
+        """
+        load_template.cache_clear()
+
+    def tearDown(self) -> None:
+        """
+        Discard any mocked template cached during a test.
+        """
+        load_template.cache_clear()
+
+    @patch('rigel.files.renderer.load_resource')
     @patch('rigel.files.renderer.Template')
-    @patch('builtins.open', new_callable=mock_open())
     def test_renderer(
             self,
-            open_mock: Mock,
             template_mock: Mock,
             resources_mock: Mock
             ) -> None:
@@ -34,19 +45,35 @@ class RendererTesting(unittest.TestCase):
         filepath = f'test_path/{input_file}'.encode()
         resources_mock.return_value = filepath
 
-        template = 'Template'
-        template_data = 'File content.'
-
         template_instance = MagicMock()
-        template_instance.return_value = template
-        template_instance.render.return_value = template_data
         template_mock.return_value = template_instance
 
-        test_configuration = DockerSection(**self.configuration_data)
+        test_configuration = DockerSection.parse_obj(self.configuration_data)
         Renderer(test_configuration).render(input_file, output_file)
 
-        resources_mock.assert_called_once_with('rigel.files.renderer', f'assets/templates/{input_file}')
+        resources_mock.assert_called_once_with(f'assets/templates/{input_file}')
         template_mock.assert_called_once_with(filepath.decode())
-        open_mock.assert_called_once_with(output_file, 'w+')
-        template_instance.render.assert_called_once_with(configuration=test_configuration.dict())
-        open_mock.return_value.__enter__().write.assert_called_once_with(template_data)
+        template_instance.stream.assert_called_once_with(configuration=test_configuration.dict())
+        template_instance.stream.return_value.dump.assert_called_once_with(output_file, encoding='utf-8')
+
+    @patch('rigel.files.renderer.load_resource')
+    @patch('rigel.files.renderer.Template')
+    def test_renderer_template_cache(
+            self,
+            template_mock: Mock,
+            resources_mock: Mock
+            ) -> None:
+        """
+        Test if template files are only read and compiled once when rendered multiple times.
+        """
+        input_file = 'TestTemplate.j2'
+        resources_mock.return_value = f'test_path/{input_file}'.encode()
+
+        test_configuration = DockerSection.parse_obj(self.configuration_data)
+        renderer = Renderer(test_configuration)
+        renderer.render(input_file, 'test_rendered_file_1')
+        renderer.render(input_file, 'test_rendered_file_2')
+
+        resources_mock.assert_called_once()
+        template_mock.assert_called_once()
+        self.assertEqual(template_mock.return_value.stream.call_count, 2)
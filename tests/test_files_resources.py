@@ -0,0 +1,29 @@
+import unittest
+from rigel.files.resources import load_resource
+from unittest.mock import Mock, patch
+
+
+class LoadResourceTesting(unittest.TestCase):
+    """
+    Test suite for rigel.files.resources.load_resource function.
+    """
+
+    def test_load_packaged_resource(self) -> None:
+        """
+        Test if resource files shipped with the package are loaded as expected.
+        """
+        self.assertTrue(load_resource('assets/Rigelfile').startswith(b'# This file was generate'))
+
+    @patch('rigel.files.resources.pkgutil.get_data')
+    def test_unavailable_resource_error(self, get_data_mock: Mock) -> None:
+        """
+        Test if FileNotFoundError is thrown if the package loader cannot provide a resource.
+        """
+        get_data_mock.return_value = None
+        with self.assertRaises(FileNotFoundError):
+            load_resource('assets/Rigelfile')
+        get_data_mock.assert_called_once_with('rigel.files.resources', 'assets/Rigelfile')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -53,9 +53,10 @@ class DockerSectionTesting(unittest.TestCase):
             'image': 'test-image',
             'package': 'test-package'
         }
-        section = DockerSection(**data)
+        section = DockerSection.parse_obj(data)
         self.assertEqual(section.distro, test_distro)
         self.assertEqual(section.ros_image, test_distro)
+        self.assertNotIn('ros_image', data)  # input data is left untouched
 
     def test_custom_ros_image(self) -> None:
         """
@@ -70,7 +71,7 @@ class DockerSectionTesting(unittest.TestCase):
             'package': 'test-package',
             'ros_image': test_ros_image
         }
-        section = DockerSection(**data)
+        section = DockerSection.parse_obj(data)
         self.assertEqual(section.distro, test_distro)
         self.assertEqual(section.ros_image, test_ros_image)
 
@@ -87,7 +88,7 @@ class DockerSectionTesting(unittest.TestCase):
             'compiler': compiler
         }
         with self.assertRaises(UnsupportedCompilerError) as context:
-            DockerSection(**data)
+            DockerSection.parse_obj(data)
         self.assertEqual(context.exception.kwargs['compiler'], compiler)
 
     def test_unsupported_platform_error(self) -> None:
@@ -104,7 +105,7 @@ class DockerSectionTesting(unittest.TestCase):
         }
 
         with self.assertRaises(UnsupportedPlatformError) as context:
-            DockerSection(**data)
+            DockerSection.parse_obj(data)
         self.assertEqual(context.exception.kwargs['platform'], platform)
 
 